@@ -23,6 +23,7 @@ from ..extras.constants import EngineName
 from ..extras.misc import torch_gc
 from ..extras.packages import is_fastapi_available, is_starlette_available, is_uvicorn_available
 from .chat import (
+    close_http_session,
     create_chat_completion_response,
     create_score_evaluation_response,
     create_stream_chat_completion_response,
@@ -63,6 +64,7 @@ async def lifespan(app: "FastAPI", chat_model: "ChatModel"):  # collects GPU mem
         asyncio.create_task(sweeper())
 
     yield
+    await close_http_session()
     torch_gc()
 
 
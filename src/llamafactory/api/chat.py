@@ -12,20 +12,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import base64
 import io
-import json
+import ipaddress
 import os
+import queue
 import re
-import uuid
+import secrets
+import socket
+import stat
+import time
 from collections.abc import AsyncGenerator
-from typing import TYPE_CHECKING, Optional
+from functools import lru_cache
+from typing import IO, TYPE_CHECKING, Optional, Union
+from urllib.parse import urljoin, urlparse
+
+import orjson
 
 from ..data import Role as DataRole
 from ..extras import logging
 from ..extras.constants import AUDIO_PLACEHOLDER, IMAGE_PLACEHOLDER, VIDEO_PLACEHOLDER
 from ..extras.misc import is_env_enabled
-from ..extras.packages import is_fastapi_available, is_pillow_available, is_requests_available
+from ..extras.packages import is_aiohttp_available, is_fastapi_available, is_pillow_available
 from .common import dictify, jsonify
 from .protocol import (
     ChatCompletionMessage,
@@ -50,8 +59,39 @@ if is_pillow_available():
     from PIL import Image
 
 
-if is_requests_available():
-    import requests
+if is_aiohttp_available():
+    import aiohttp
+
+    class _PinnedResolver(aiohttp.abc.AbstractResolver):
+        r"""Resolver that connects through the addresses validated by the SSRF check.
+
+        Letting the fetch re-resolve the hostname would allow dns rebinding to swap in a private
+        address between check and fetch; serving the checked addresses pins the connection.
+        """
+
+        def __init__(self) -> None:
+            self._fallback = aiohttp.DefaultResolver()
+
+        async def resolve(self, host: str, port: int = 0, family: int = socket.AF_INET) -> list[dict]:
+            cached = _DNS_CACHE.get(host)
+            if cached is not None and cached[1]:
+                return [
+                    {
+                        "hostname": host,
+                        "host": address,
+                        "port": port,
+                        "family": socket.AF_INET6 if ":" in address else socket.AF_INET,
+                        "proto": 0,
+                        "flags": socket.AI_NUMERICHOST,
+                    }
+                    for address in cached[1]
+                ]
+
+            # whitelisted hosts and ip literals skip the dns check, resolve them normally
+            return await self._fallback.resolve(host, port, family)
+
+        async def close(self) -> None:
+            await self._fallback.close()
 
 
 if TYPE_CHECKING:
@@ -61,6 +101,39 @@ if TYPE_CHECKING:
 
 
 logger = logging.get_logger(__name__)
+_API_VERBOSE = is_env_enabled("API_VERBOSE", "1")  # read once, toggling verbose mode requires a restart
+_ALLOW_LOCAL_FILES = is_env_enabled("ALLOW_LOCAL_FILES", "1")  # read once as well
+ALLOWED_URL_PREFIXES = tuple(
+    prefix.strip() for prefix in os.getenv("ALLOWED_URL_PREFIXES", "").split(",") if prefix.strip()
+)
+# str.startswith accepts a tuple and scans it entirely in C, which wins for small whitelists;
+# for large ones a single pass over the compiled alternation beats trying every prefix
+_URL_PREFIX_RE = (
+    re.compile("^(?:" + "|".join(map(re.escape, ALLOWED_URL_PREFIXES)) + ")")
+    if len(ALLOWED_URL_PREFIXES) > 16
+    else None
+)
+_DNS_CACHE: dict[str, tuple[float, Optional[list[str]]]] = {}  # hostname -> (timestamp, global addresses or None)
+_DNS_CACHE_TTL = 30.0  # seconds
+_BUFFER_POOL: "queue.LifoQueue[io.BytesIO]" = queue.LifoQueue(maxsize=64)
+_MAX_POOLED_BUFFER_BYTES = 1024 * 1024  # larger buffers are cheap to reallocate relative to their decode cost
+_BASE64_MARKER = ";base64,"
+_MEDIA_DATA_URI_PREFIXES = {
+    "image_url": "data:image/",
+    "video_url": "data:video/",
+    "audio_url": "data:audio/",
+}
+_MEDIA_PLACEHOLDERS = {
+    "image_url": IMAGE_PLACEHOLDER,
+    "video_url": VIDEO_PLACEHOLDER,
+    "audio_url": AUDIO_PLACEHOLDER,
+}
+MAX_MEDIA_BYTES = int(os.getenv("MAX_MEDIA_BYTES", str(32 * 1024 * 1024)))
+_MAX_MEDIA_REDIRECTS = 5
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+SAFE_MEDIA_PATH = os.getenv("SAFE_MEDIA_PATH", "")
+# resolve the safe directory once at import time, it is constant for the process lifetime
+_SAFE_MEDIA_PATH_REAL = os.path.realpath(SAFE_MEDIA_PATH) if SAFE_MEDIA_PATH else None
 ROLE_MAPPING = {
     Role.USER: DataRole.USER.value,
     Role.ASSISTANT: DataRole.ASSISTANT.value,
@@ -68,9 +141,235 @@ ROLE_MAPPING = {
     Role.FUNCTION: DataRole.FUNCTION.value,
     Role.TOOL: DataRole.OBSERVATION.value,
 }
+_USER_ROLES = frozenset({Role.USER, Role.TOOL})
+_ASSISTANT_ROLES = frozenset({Role.ASSISTANT, Role.FUNCTION})
+
+
+async def _resolve_hostname_is_global(hostname: str) -> bool:
+    r"""Resolve a hostname and check that every address is globally routable, caching the verdict briefly.
+
+    Validated addresses stay in the cache so the pinned resolver connects to exactly what was checked.
+    """
+    try:  # ip literals need no dns resolution (urlparse already strips the brackets of ipv6 hosts)
+        return ipaddress.ip_address(hostname).is_global
+    except ValueError:
+        pass
+
+    now = time.monotonic()
+    cached = _DNS_CACHE.get(hostname)
+    if cached is not None and now - cached[0] < _DNS_CACHE_TTL:
+        return cached[1] is not None
+
+    try:  # getaddrinfo blocks, a slow resolver must not stall the event loop
+        addr_infos = await asyncio.to_thread(socket.getaddrinfo, hostname, None, proto=socket.IPPROTO_TCP)
+    except socket.gaierror:
+        return False
+
+    addresses = [addr_info[4][0] for addr_info in addr_infos]
+    is_global = all(ipaddress.ip_address(address).is_global for address in addresses)
+    if len(_DNS_CACHE) > 1024:  # prune expired entries only: evicting a live entry would unpin a validated host
+        for cached_hostname, (timestamp, _) in list(_DNS_CACHE.items()):
+            if now - timestamp >= _DNS_CACHE_TTL:
+                del _DNS_CACHE[cached_hostname]
+
+    _DNS_CACHE[hostname] = (now, addresses if is_global else None)
+    return is_global
+
+
+async def _check_ssrf_url(url: str) -> None:
+    r"""Check if the remote media URL matches the configured whitelist or resolves to a global address."""
+    if ALLOWED_URL_PREFIXES:  # explicitly whitelisted prefixes are trusted
+        if _URL_PREFIX_RE is not None:
+            if _URL_PREFIX_RE.match(url) is None:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"URL is not allowed: {url}.")
+        elif not url.startswith(ALLOWED_URL_PREFIXES):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"URL is not allowed: {url}.")
+
+        return
+
+    # the validated addresses stay cached and the session's pinned resolver connects to them,
+    # so dns rebinding cannot swap in a different address between check and fetch
+    hostname = urlparse(url).hostname
+    if hostname is None or not await _resolve_hostname_is_global(hostname):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"URL is not allowed: {url}.")
+
+
+@lru_cache(maxsize=256)
+def _resolve_parent_dir(dirname: str) -> str:
+    r"""Resolve a parent directory to its canonical form, caching it since directories repeat across files."""
+    return os.path.realpath(dirname)
+
+
+@lru_cache(maxsize=1024)
+def _resolve_media_path(path: str) -> str:
+    r"""Resolve a media path to its canonical form, caching results since paths repeat across requests."""
+    abs_path = os.path.abspath(path)
+    parent_dir = os.path.dirname(abs_path)
+    try:
+        # abspath is only sound when the parent chain is already canonical and the file itself is no symlink,
+        # otherwise a symlinked directory would slip through unresolved
+        if _resolve_parent_dir(parent_dir) == parent_dir and not stat.S_ISLNK(os.lstat(abs_path).st_mode):
+            return abs_path
+    except OSError:
+        pass
+
+    return os.path.realpath(path)
+
+
+def _check_lfi_path(path: str) -> None:
+    r"""Check if the local media path stays inside the safe media directory (if configured)."""
+    if not _ALLOW_LOCAL_FILES:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Local file access is disabled: {path}.")
+
+    if _SAFE_MEDIA_PATH_REAL is None:  # no safe directory configured
+        return
+
+    safe_prefix = _SAFE_MEDIA_PATH_REAL + os.sep
+    normalized_path = os.path.normpath(os.path.abspath(path))
+    if not normalized_path.startswith(safe_prefix):  # cheap pre-filter without extra syscalls
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Path is not allowed: {path}.")
+
+    try:  # fast path: a regular, non-hard-linked file under a canonical parent chain cannot redirect
+        parent_dir = os.path.dirname(normalized_path)
+        if _resolve_parent_dir(parent_dir) == parent_dir:
+            file_stat = os.lstat(normalized_path)
+            if not stat.S_ISLNK(file_stat.st_mode) and file_stat.st_nlink == 1:
+                return
+    except OSError:
+        pass
+
+    if not _resolve_media_path(path).startswith(safe_prefix):  # symlinks may still escape, resolve to confirm
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Path is not allowed: {path}.")
+
+
+def _acquire_buffer() -> io.BytesIO:
+    r"""Take a reusable buffer from the pool (stored empty), or allocate a fresh one when the pool is empty."""
+    try:
+        return _BUFFER_POOL.get_nowait()
+    except queue.Empty:
+        return io.BytesIO()
+
+
+def _release_buffer(buffer: io.BytesIO) -> None:
+    r"""Return a fully consumed buffer to the pool, dropping it when oversized or the pool is full.
+
+    Truncating on release keeps the idle pool from pinning burst-sized allocations indefinitely.
+    """
+    if buffer.getbuffer().nbytes > _MAX_POOLED_BUFFER_BYTES:
+        return
+
+    buffer.seek(0)
+    buffer.truncate()
+    try:
+        _BUFFER_POOL.put_nowait(buffer)
+    except queue.Full:
+        pass
+
+
+def _is_data_uri(url: str, input_type: str) -> bool:
+    r"""Check for a base64 data URI with plain string ops, instead of running a regex over the payload."""
+    prefix = _MEDIA_DATA_URI_PREFIXES[input_type]
+    # the subtype sits between the prefix and ";base64,", so a bounded find avoids scanning the payload
+    return url.startswith(prefix) and url.find(_BASE64_MARKER, len(prefix), len(prefix) + 30) != -1
+
+
+def _decode_data_uri(url: str) -> bytes:
+    r"""Decode the base64 payload of a data URI without slicing the (potentially huge) string."""
+    # the payload starts right after ";base64,"; a media-type parameter may contain commas, so do not split on them
+    offset = url.find(_BASE64_MARKER) + len(_BASE64_MARKER)
+    return base64.b64decode(memoryview(url.encode("ascii"))[offset:])
+
+
+async def _resolve_media_stream(url: str, input_type: str) -> Optional[Union[IO[bytes], str]]:
+    r"""Resolve a media URL to a binary stream (or a plain path for local video/audio files).
+
+    Returns ``None`` for web uris, which are downloaded in parallel afterwards.
+    """
+    if _is_data_uri(url, input_type):  # base64 media
+        buffer = _acquire_buffer()
+        buffer.write(_decode_data_uri(url))
+        buffer.seek(0)
+        return buffer
+    elif os.path.isfile(url):  # local file
+        _check_lfi_path(url)
+        return open(url, "rb") if input_type == "image_url" else url
+    else:  # web uri
+        await _check_ssrf_url(url)
+        return None
+
+
+_HTTP_SESSION: Optional["aiohttp.ClientSession"] = None
+_HTTP_SESSION_LOOP: Optional["asyncio.AbstractEventLoop"] = None
+
+
+def _get_http_session() -> "aiohttp.ClientSession":
+    r"""Get the shared http session, created lazily so it binds to the running event loop.
+
+    Reusing one session keeps connections pooled, so repeated media hosts skip the tcp/tls handshakes.
+    """
+    global _HTTP_SESSION, _HTTP_SESSION_LOOP
+    loop = asyncio.get_running_loop()
+    # a session left over from a finished event loop is unusable but not closed, replace it as well
+    if _HTTP_SESSION is None or _HTTP_SESSION.closed or _HTTP_SESSION_LOOP is not loop:
+        _HTTP_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=64, limit_per_host=32, ttl_dns_cache=_DNS_CACHE_TTL, resolver=_PinnedResolver()
+            ),
+            timeout=aiohttp.ClientTimeout(total=60, connect=10),
+        )
+        _HTTP_SESSION_LOOP = loop
+
+    return _HTTP_SESSION
+
+
+async def close_http_session() -> None:
+    r"""Close the shared http session, releasing the pooled connections on app shutdown."""
+    global _HTTP_SESSION, _HTTP_SESSION_LOOP
+    if _HTTP_SESSION is not None and not _HTTP_SESSION.closed:
+        await _HTTP_SESSION.close()
+
+    _HTTP_SESSION = None
+    _HTTP_SESSION_LOOP = None
+
+
+async def _fetch_media(session: "aiohttp.ClientSession", url: str) -> io.BytesIO:
+    r"""Download a remote media URL into a memory buffer, rejecting oversized payloads early.
+
+    Redirects are followed manually so every hop passes the SSRF check before it is fetched.
+    """
+    for _ in range(_MAX_MEDIA_REDIRECTS + 1):
+        async with session.get(url, allow_redirects=False) as response:
+            if response.status in _REDIRECT_STATUSES:
+                location = response.headers.get("Location")
+                if location is None:
+                    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid redirect: {url}.")
+
+                url = urljoin(str(response.url), location)
+                await _check_ssrf_url(url)
+                continue
+
+            buffer = _acquire_buffer()
+            async for chunk in response.content.iter_chunked(65536):
+                buffer.write(chunk)
+                if buffer.tell() > MAX_MEDIA_BYTES:
+                    _release_buffer(buffer)
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"Media exceeds {MAX_MEDIA_BYTES} bytes: {url}.",
+                    )
+
+            buffer.seek(0)
+            return buffer
+
+    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Too many redirects: {url}.")
 
 
-def _process_request(
+def _decode_image(stream: IO[bytes]) -> "ImageInput":
+    r"""Decode an image stream to RGB, fully materializing the pixel data."""
+    return Image.open(stream).convert("RGB")
+
+
+async def _process_request(
     request: "ChatCompletionRequest",
 ) -> tuple[
     list[dict[str, str]],
@@ -80,8 +379,9 @@ def _process_request(
     Optional[list["VideoInput"]],
     Optional[list["AudioInput"]],
 ]:
-    if is_env_enabled("API_VERBOSE", "1"):
-        logger.info_rank0(f"==== request ====\n{json.dumps(dictify(request), indent=2, ensure_ascii=False)}")
+    if _API_VERBOSE:
+        request_json = orjson.dumps(dictify(request), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        logger.info_rank0(f"==== request ====\n{request_json}")
 
     if len(request.messages) == 0:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid length")
@@ -95,77 +395,77 @@ def _process_request(
     if len(request.messages) % 2 == 0:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Only supports u/a/u/a/u...")
 
-    input_messages = []
-    images, videos, audios = [], [], []
-    for i, message in enumerate(request.messages):
-        if i % 2 == 0 and message.role not in [Role.USER, Role.TOOL]:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid role")
-        elif i % 2 == 1 and message.role not in [Role.ASSISTANT, Role.FUNCTION]:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid role")
+    roles = [message.role for message in request.messages]
+    if not all(role in _USER_ROLES for role in roles[0::2]) or not all(
+        role in _ASSISTANT_ROLES for role in roles[1::2]
+    ):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid role")
 
+    input_messages = []
+    image_streams, videos, audios = [], [], []
+    pending_fetches = []  # (target list, index, url) of web uris, downloaded in parallel after the loop
+    for message in request.messages:
         if message.role == Role.ASSISTANT and isinstance(message.tool_calls, list) and len(message.tool_calls):
             tool_calls = [
                 {"name": tool_call.function.name, "arguments": tool_call.function.arguments}
                 for tool_call in message.tool_calls
             ]
-            content = json.dumps(tool_calls, ensure_ascii=False)
+            content = orjson.dumps(tool_calls).decode()
             input_messages.append({"role": ROLE_MAPPING[Role.FUNCTION], "content": content})
         elif isinstance(message.content, list):
-            text_content = ""
+            text_parts = []
             for input_item in message.content:
                 if input_item.type == "text":
-                    text_content += input_item.text
-                elif input_item.type == "image_url":
-                    text_content += IMAGE_PLACEHOLDER
-                    image_url = input_item.image_url.url
-                    if re.match(r"^data:image\/(png|jpg|jpeg|gif|bmp);base64,(.+)$", image_url):  # base64 image
-                        image_stream = io.BytesIO(base64.b64decode(image_url.split(",", maxsplit=1)[1]))
-                    elif os.path.isfile(image_url):  # local file
-                        image_stream = open(image_url, "rb")
-                    else:  # web uri
-                        image_stream = requests.get(image_url, stream=True).raw
-
-                    images.append(Image.open(image_stream).convert("RGB"))
-                elif input_item.type == "video_url":
-                    text_content += VIDEO_PLACEHOLDER
-                    video_url = input_item.video_url.url
-                    if re.match(r"^data:video\/(mp4|mkv|avi|mov);base64,(.+)$", video_url):  # base64 video
-                        video_stream = io.BytesIO(base64.b64decode(video_url.split(",", maxsplit=1)[1]))
-                    elif os.path.isfile(video_url):  # local file
-                        video_stream = video_url
-                    else:  # web uri
-                        video_stream = requests.get(video_url, stream=True).raw
-
-                    videos.append(video_stream)
-                elif input_item.type == "audio_url":
-                    text_content += AUDIO_PLACEHOLDER
-                    audio_url = input_item.audio_url.url
-                    if re.match(r"^data:audio\/(mpeg|mp3|wav|ogg);base64,(.+)$", audio_url):  # base64 audio
-                        audio_stream = io.BytesIO(base64.b64decode(audio_url.split(",", maxsplit=1)[1]))
-                    elif os.path.isfile(audio_url):  # local file
-                        audio_stream = audio_url
-                    else:  # web uri
-                        audio_stream = requests.get(audio_url, stream=True).raw
-
-                    audios.append(audio_stream)
+                    text_parts.append(input_item.text)
+                elif input_item.type in _MEDIA_PLACEHOLDERS:
+                    text_parts.append(_MEDIA_PLACEHOLDERS[input_item.type])
+                    if input_item.type == "image_url":
+                        target_list = image_streams
+                    elif input_item.type == "video_url":
+                        target_list = videos
+                    else:
+                        target_list = audios
+
+                    media_url = getattr(input_item, input_item.type).url
+                    media_stream = await _resolve_media_stream(media_url, input_item.type)
+                    if media_stream is None:  # web uri
+                        pending_fetches.append((target_list, len(target_list), media_url))
+
+                    target_list.append(media_stream)
                 else:
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid input type {input_item.type}."
                     )
 
-            input_messages.append({"role": ROLE_MAPPING[message.role], "content": text_content})
+            input_messages.append({"role": ROLE_MAPPING[message.role], "content": "".join(text_parts)})
         else:
             input_messages.append({"role": ROLE_MAPPING[message.role], "content": message.content})
 
     tool_list = request.tools
     if isinstance(tool_list, list) and len(tool_list):
         try:
-            tools = json.dumps([dictify(tool.function) for tool in tool_list], ensure_ascii=False)
-        except json.JSONDecodeError:
+            tools = orjson.dumps([dictify(tool.function) for tool in tool_list]).decode()
+        except orjson.JSONEncodeError:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid tools")
     else:
         tools = None
 
+    if pending_fetches:  # download all web uris concurrently instead of blocking the event loop per url
+        session = _get_http_session()
+        fetched_streams = await asyncio.gather(*(_fetch_media(session, url) for _, _, url in pending_fetches))
+
+        for (target_list, index, _), media_stream in zip(pending_fetches, fetched_streams):
+            target_list[index] = media_stream
+
+    images = []
+    if image_streams:  # image decoding is pure cpu work, keep it off the event loop
+        images = list(await asyncio.gather(*(asyncio.to_thread(_decode_image, s) for s in image_streams)))
+        for image_stream in image_streams:
+            if isinstance(image_stream, io.BytesIO):  # video/audio streams live on, image buffers can be recycled
+                _release_buffer(image_stream)
+            else:
+                image_stream.close()
+
     return input_messages, system, tools, images or None, videos or None, audios or None
 
 
@@ -184,8 +484,8 @@ def _create_stream_chat_completion_chunk(
 async def create_chat_completion_response(
     request: "ChatCompletionRequest", chat_model: "ChatModel"
 ) -> "ChatCompletionResponse":
-    completion_id = f"chatcmpl-{uuid.uuid4().hex}"
-    input_messages, system, tools, images, videos, audios = _process_request(request)
+    completion_id = f"chatcmpl-{secrets.token_hex(16)}"
+    input_messages, system, tools, images, videos, audios = await _process_request(request)
     responses = await chat_model.achat(
         input_messages,
         system,
@@ -214,7 +514,7 @@ async def create_chat_completion_response(
             tool_calls = []
             for tool in result:
                 function = Function(name=tool.name, arguments=tool.arguments)
-                tool_calls.append(FunctionCall(id=f"call_{uuid.uuid4().hex}", function=function))
+                tool_calls.append(FunctionCall(id=f"call_{secrets.token_hex(16)}", function=function))
 
             response_message = ChatCompletionMessage(role=Role.ASSISTANT, tool_calls=tool_calls)
             finish_reason = Finish.TOOL
@@ -238,8 +538,8 @@ async def create_chat_completion_response(
 async def create_stream_chat_completion_response(
     request: "ChatCompletionRequest", chat_model: "ChatModel"
 ) -> AsyncGenerator[str, None]:
-    completion_id = f"chatcmpl-{uuid.uuid4().hex}"
-    input_messages, system, tools, images, videos, audios = _process_request(request)
+    completion_id = f"chatcmpl-{secrets.token_hex(16)}"
+    input_messages, system, tools, images, videos, audios = await _process_request(request)
     if tools:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot stream function calls.")
 
@@ -277,7 +577,7 @@ async def create_stream_chat_completion_response(
 async def create_score_evaluation_response(
     request: "ScoreEvaluationRequest", chat_model: "ChatModel"
 ) -> "ScoreEvaluationResponse":
-    score_id = f"scoreval-{uuid.uuid4().hex}"
+    score_id = f"scoreval-{secrets.token_hex(16)}"
     if len(request.messages) == 0:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid request")
 
@@ -46,6 +46,10 @@ def is_librosa_available():
     return _is_package_available("librosa")
 
 
+def is_aiohttp_available():
+    return _is_package_available("aiohttp")
+
+
 def is_fastapi_available():
     return _is_package_available("fastapi")
 
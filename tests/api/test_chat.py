@@ -0,0 +1,165 @@
+# Copyright 2025 the LlamaFactory team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import base64
+import os
+import socket
+
+import pytest
+from fastapi import HTTPException
+
+from llamafactory.api import chat
+
+
+IMAGE_PAYLOAD = base64.b64encode(b"image bytes").decode()
+
+
+def _setup_sandbox(monkeypatch: pytest.MonkeyPatch, tmp_path) -> str:
+    safe_dir = tmp_path / "safe"
+    outside_dir = tmp_path / "outside"
+    safe_dir.mkdir()
+    outside_dir.mkdir()
+    (safe_dir / "ok.txt").write_text("ok")
+    (outside_dir / "secret.txt").write_text("secret")
+    os.symlink(outside_dir / "secret.txt", safe_dir / "evil_file")
+    os.symlink(outside_dir, safe_dir / "evil_dir")
+    monkeypatch.setattr(chat, "_ALLOW_LOCAL_FILES", True)
+    monkeypatch.setattr(chat, "_SAFE_MEDIA_PATH_REAL", os.path.realpath(str(safe_dir)))
+    chat._resolve_media_path.cache_clear()
+    chat._resolve_parent_dir.cache_clear()
+    return str(safe_dir)
+
+
+def test_check_lfi_path_accepts_safe_file(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    safe_dir = _setup_sandbox(monkeypatch, tmp_path)
+    chat._check_lfi_path(os.path.join(safe_dir, "ok.txt"))
+
+
+def test_check_lfi_path_rejects_escapes(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    safe_dir = _setup_sandbox(monkeypatch, tmp_path)
+    escape_paths = [
+        os.path.join(safe_dir, "..", "outside", "secret.txt"),  # dot-dot escape
+        os.path.join(safe_dir, "evil_file"),  # symlinked file escape
+        os.path.join(safe_dir, "evil_dir", "secret.txt"),  # symlinked directory escape
+    ]
+    for escape_path in escape_paths:
+        with pytest.raises(HTTPException):
+            chat._check_lfi_path(escape_path)
+
+
+def test_check_lfi_path_disabled(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    safe_dir = _setup_sandbox(monkeypatch, tmp_path)
+    monkeypatch.setattr(chat, "_ALLOW_LOCAL_FILES", False)
+    with pytest.raises(HTTPException):
+        chat._check_lfi_path(os.path.join(safe_dir, "ok.txt"))
+
+
+def test_check_ssrf_url_whitelist(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(chat, "ALLOWED_URL_PREFIXES", ("https://cdn.example.com/",))
+    monkeypatch.setattr(chat, "_URL_PREFIX_RE", None)
+    asyncio.run(chat._check_ssrf_url("https://cdn.example.com/a.png"))
+    with pytest.raises(HTTPException):
+        asyncio.run(chat._check_ssrf_url("https://evil.example.com/a.png"))
+
+
+def test_check_ssrf_url_ip_literal(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(chat, "ALLOWED_URL_PREFIXES", ())
+    monkeypatch.setattr(chat, "_URL_PREFIX_RE", None)
+    asyncio.run(chat._check_ssrf_url("http://93.184.216.34/a.png"))
+    for private_url in ["http://127.0.0.1/a.png", "http://10.0.0.1/a.png", "http://[::1]/a.png"]:
+        with pytest.raises(HTTPException):
+            asyncio.run(chat._check_ssrf_url(private_url))
+
+
+def test_check_ssrf_url_hostname(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(chat, "ALLOWED_URL_PREFIXES", ())
+    monkeypatch.setattr(chat, "_URL_PREFIX_RE", None)
+    chat._DNS_CACHE.clear()
+    addresses = {"private.example.com": "10.0.0.1", "public.example.com": "93.184.216.34"}
+
+    def fake_getaddrinfo(host, port, **kwargs):
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (addresses[host], 0))]
+
+    monkeypatch.setattr(socket, "getaddrinfo", fake_getaddrinfo)
+    with pytest.raises(HTTPException):
+        asyncio.run(chat._check_ssrf_url("http://private.example.com/a.png"))
+
+    asyncio.run(chat._check_ssrf_url("http://public.example.com/a.png"))
+    # the validated addresses must be cached so the pinned resolver connects to them
+    assert chat._DNS_CACHE["public.example.com"][1] == ["93.184.216.34"]
+    chat._DNS_CACHE.clear()
+
+
+def test_is_data_uri():
+    assert chat._is_data_uri(f"data:image/png;base64,{IMAGE_PAYLOAD}", "image_url")
+    assert not chat._is_data_uri(f"data:image/png;base64,{IMAGE_PAYLOAD}", "audio_url")
+    assert not chat._is_data_uri("data:image/png,plain payload", "image_url")
+    assert not chat._is_data_uri("https://example.com/a.png", "image_url")
+
+
+def test_decode_data_uri():
+    assert chat._decode_data_uri(f"data:image/png;base64,{IMAGE_PAYLOAD}") == b"image bytes"
+    # a comma inside a media-type parameter must not shift the payload offset
+    assert chat._decode_data_uri(f"data:image/png;name=a,b;base64,{IMAGE_PAYLOAD}") == b"image bytes"
+
+
+class _FakeContent:
+    def __init__(self, chunks: list[bytes]):
+        self._chunks = chunks
+
+    async def iter_chunked(self, size: int):
+        for chunk in self._chunks:
+            yield chunk
+
+
+class _FakeResponse:
+    def __init__(self, chunks: list[bytes], status: int = 200, headers: dict = None, url: str = "http://example.com"):
+        self.content = _FakeContent(chunks)
+        self.status = status
+        self.headers = headers or {}
+        self.url = url
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class _FakeSession:
+    def __init__(self, responses: list[_FakeResponse]):
+        self._responses = list(responses)
+
+    def get(self, url: str, **kwargs):
+        return self._responses.pop(0)
+
+
+def test_fetch_media_size_cap(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(chat, "MAX_MEDIA_BYTES", 8)
+    session = _FakeSession([_FakeResponse([b"1234", b"5678"])])
+    buffer = asyncio.run(chat._fetch_media(session, "http://example.com/a.png"))
+    assert buffer.read() == b"12345678"
+    session = _FakeSession([_FakeResponse([b"x" * 16])])
+    with pytest.raises(HTTPException):
+        asyncio.run(chat._fetch_media(session, "http://example.com/a.png"))
+
+
+def test_fetch_media_checks_redirects(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(chat, "ALLOWED_URL_PREFIXES", ())
+    monkeypatch.setattr(chat, "_URL_PREFIX_RE", None)
+    # a redirect to a private address must fail the SSRF check instead of being followed blindly
+    redirect = _FakeResponse([], status=302, headers={"Location": "http://127.0.0.1/secret"})
+    with pytest.raises(HTTPException):
+        asyncio.run(chat._fetch_media(_FakeSession([redirect]), "http://public.example.com/a.png"))